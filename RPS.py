@@ -1,34 +1,39 @@
 import random
 import pygame
 from typing import Tuple, Optional
+from kinds import KIND_ID
+
+
+# Collision radius as a fraction of the larger icon side
+RADIUS_FACTOR = 0.30
 
 
 class RPS:
 
+    # Fixed attribute layout: slot descriptors instead of a per-instance __dict__
+    __slots__ = ("image", "size", "rect", "cx", "cy", "radius", "vx", "vy", "kind", "kind_id")
+
     def __init__(
         self,
-        img_path: str,
+        image: pygame.Surface,
         arena_rect: pygame.Rect,
-        size: Tuple[int, int] = (150, 150),
         center: Optional[Tuple[float, float]] = None,
         speed_range: Tuple[float, float] = (120.0, 220.0),
     ) -> None:
-        # Arena bounds 
-        self.arena: pygame.Rect = arena_rect.copy()
-
-        # Load & scale
-        self.image: pygame.Surface = pygame.image.load(img_path).convert_alpha()
-        self.size: Tuple[int, int] = size
-        if self.size:
-            self.image = pygame.transform.smoothscale(self.image, self.size)
-
-        # Cached rect + center (float for physics, int for blitting)
-        self.rect: pygame.Rect = self.image.get_rect(center=center or self.arena.center)
+        # Pre-scaled, shared surface (e.g. from AssetCache); nothing is loaded here
+        self.image: pygame.Surface = image
+        self.size: Tuple[int, int] = image.get_size()
+
+        # Cached rect + center (float for physics, int for blitting).
+        # cx/cy/vx/vy are spawn-time values only: CollisionManager owns motion
+        # from its first step() on and writes them back only in flush() (the
+        # rect is moved by sync_rects() for drawing).
+        self.rect: pygame.Rect = self.image.get_rect(center=center or arena_rect.center)
         self.cx: float = float(self.rect.centerx)
         self.cy: float = float(self.rect.centery)
 
         # Cached collision radius 
-        self.radius: float = 0.30 * max(self.rect.width, self.rect.height)
+        self.radius: float = RADIUS_FACTOR * max(self.rect.width, self.rect.height)
 
         # Random initial velocity 
         angle = random.uniform(0.0, 360.0)
@@ -39,93 +44,55 @@ class RPS:
 
         # Logical kind; subclasses set this appropriately after super().__init__
         self.kind: str = "unknown"
+        self.kind_id: int = -1
 
     # ---------- public API ----------
 
-    def set_center(self, x: float, y: float) -> None:
-        
-        self.cx, self.cy = x, y
-        self.rect.centerx = int(x)
-        self.rect.centery = int(y)
-
-    def set_size(self, width: int, height: int) -> None:
-        self.size = (width, height)
-        # Keep current center while rescaling
-        c = (self.rect.centerx, self.rect.centery)
-        self.image = pygame.transform.smoothscale(self.image, self.size)
-        self.rect = self.image.get_rect(center=c)
-        self.cx, self.cy = float(self.rect.centerx), float(self.rect.centery)
-        self.radius = 0.30 * max(self.rect.width, self.rect.height)
-
-    def draw(self, screen: pygame.Surface) -> None:
-        screen.blit(self.image, self.rect)
-
-    def update(self, dt: float) -> None:
-        """
-        Integrate motion and bounce off arena borders.
+    def morph_to(self, kind: str, surface: pygame.Surface) -> None:
         """
-        # Integrate
-        nx = self.cx + self.vx * dt
-        ny = self.cy + self.vy * dt
-        self.set_center(nx, ny)
-
-        # Horizontal bounce
-        if self.rect.left <= self.arena.left:
-            self.rect.left = self.arena.left
-            self.cx = float(self.rect.centerx)
-            self.vx *= -1.0
-        elif self.rect.right >= self.arena.right:
-            self.rect.right = self.arena.right
-            self.cx = float(self.rect.centerx)
-            self.vx *= -1.0
-
-        # Vertical bounce
-        if self.rect.top <= self.arena.top:
-            self.rect.top = self.arena.top
-            self.cy = float(self.rect.centery)
-            self.vy *= -1.0
-        elif self.rect.bottom >= self.arena.bottom:
-            self.rect.bottom = self.arena.bottom
-            self.cy = float(self.rect.centery)
-            self.vy *= -1.0
-
-    def get_collision_circle(self) -> Tuple[float, float, float]:
-        return self.cx, self.cy, self.radius
-
-    def morph_to(self, kind: str, img_path: str) -> None:
+        Change this sprite into another kind by swapping to a pre-scaled Surface.
+        Position, velocity, rect and radius are untouched.
         """
-        Change this sprite into another kind, preserving position/velocity.
-        """
-        self.kind = kind
-        # Keep center while swapping image
-        c = (self.rect.centerx, self.rect.centery)
-        self.image = pygame.image.load(img_path).convert_alpha()
-        if self.size:
-            self.image = pygame.transform.smoothscale(self.image, self.size)
-        self.rect = self.image.get_rect(center=c)
-        self.cx, self.cy = float(self.rect.centerx), float(self.rect.centery)
-        self.radius = 0.45 * max(self.rect.width, self.rect.height)
-
-
-    def morph_to_cached(self, kind: str, cached_surface: pygame.Surface) -> None:
-        """Fast morph: swap to pre-scaled Surface without touching rect/radius."""
         self.kind = kind
-        self.image = cached_surface
+        self.kind_id = KIND_ID[kind]
+        self.image = surface
+
 
 # subclasses that tag the kind
 class Scissors(RPS):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.kind = "scissors"
+        self.kind_id = KIND_ID["scissors"]
 
 
 class Stone(RPS):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.kind = "stone"
+        self.kind_id = KIND_ID["stone"]
 
 
 class Paper(RPS):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.kind = "paper"
+        self.kind_id = KIND_ID["paper"]
+
+
+def draw_all(screen: pygame.Surface, seq) -> None:
+    """
+    Draw every sprite in one batched call instead of one blit per sprite.
+    `seq` holds (image, rect) pairs, e.g. CollisionManager.blit_list.
+    """
+    fblits = getattr(screen, "fblits", None)  # pygame-ce only
+    if fblits is not None:
+        fblits(seq)
+    else:
+        screen.blits(seq, doreturn=False)
@@ -31,4 +31,17 @@ class Arena:
         else:
             x = random.randint(int(left), int(right))
             y = random.randint(int(top), int(bottom))
-        return (x, y)
\ No newline at end of file
+        return (x, y)
+
+    def random_points(self, count: int, padding: int = 0) -> list[tuple[float, float]]:
+        """
+        Return count random float points inside the arena, as random_point() would,
+        with the padded bounds worked out once for the whole batch.
+        """
+        max_pad = max(0, min(padding, min(self.rect.width, self.rect.height) // 2 - 1))
+        left = self.rect.left + max_pad
+        top  = self.rect.top  + max_pad
+        w = (self.rect.right  - max_pad) - left
+        h = (self.rect.bottom - max_pad) - top
+        rnd = random.random
+        return [(left + w * rnd(), top + h * rnd()) for _ in range(count)]
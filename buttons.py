@@ -9,11 +9,13 @@ class Button:
         self.color_text = color_text
         self.action = action 
 
+        # Text is static: render the label once, not every frame
+        self._label = font.render(text, True, color_text)
+        self._label_rect = self._label.get_rect(center=self.rect.center)
+
     def draw(self, screen):
         pygame.draw.rect(screen, self.color_bg, self.rect, border_radius=6)
-        label = self.font.render(self.text, True, self.color_text)
-        label_rect = label.get_rect(center=self.rect.center)
-        screen.blit(label, label_rect)
+        screen.blit(self._label, self._label_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
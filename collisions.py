@@ -1,15 +1,37 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Dict
-import math
 import random
-import time
-from typing import Sequence, Dict, Tuple, List, Set, Optional
-from collections import defaultdict
+from math import cos, sin, sqrt, tau
+from typing import TYPE_CHECKING, Callable, Sequence, Dict, Tuple, List, Optional, Iterable
+
+from kinds import KINDS
 
 if TYPE_CHECKING:
+    import pygame
     from assets import AssetCache
 
 
+# Forward half of the 8-neighborhood as (dx, dy): right, down-left, down, down-right.
+# Together with the cell itself, every pair of adjacent cells is visited once.
+_FORWARD_NEIGHBORS: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+# _MORPH_TARGET[ka * 3 + kb]: kind id (see kinds.KINDS) that `a` turns into after
+# touching `b`, or -1.
+# Stone beats scissors, paper beats stone, scissors beats paper.
+_MORPH_TARGET: Tuple[int, ...] = (
+    # b: scissors  stone  paper
+           -1,      1,    -1,     # a: scissors
+           -1,     -1,     2,     # a: stone
+            0,     -1,    -1,     # a: paper
+)
+
+# Unit vectors for random reseeding of stalled sprites, indexed by 10 random bits
+_DIR_BITS = 10
+_UNIT_DIRS: Tuple[Tuple[float, float], ...] = tuple(
+    (cos(tau * i / (1 << _DIR_BITS)), sin(tau * i / (1 << _DIR_BITS)))
+    for i in range(1 << _DIR_BITS)
+)
+
+
 class CollisionManager:
 
     def __init__(
@@ -23,6 +45,11 @@ class CollisionManager:
         morph_cooldown: float = 0.06,
     ) -> None:
 
+        if asset_cache is None:
+            # Morphs only ever swap pre-scaled surfaces; built on first _sync
+            from assets import AssetCache
+            asset_cache = AssetCache()
+
         self.img_map = img_map
         self.assets = asset_cache
         self.cell_size = cell_size
@@ -31,152 +58,423 @@ class CollisionManager:
         self.min_speed = min_speed
         self.morph_cooldown = morph_cooldown
 
-        self._last_morph: Dict[int, float] = {}
+        # Cooldowns run on simulated time (sum of the dt passed in), not wall time,
+        # so they stay in seconds at any frame rate and replay deterministically
+        self._sim_time: float = 0.0
+        self._last_morph: List[float] = []
+        self._morphs: List[Tuple[int, int]] = []
+
+        # Flat sprite state (structure of arrays), owned by step(). Sprite
+        # cx/cy/vx/vy are only written back by flush() or when a re-gather hands
+        # the state back to the sprites it was gathered from (_synced, by index).
+        self._owner: Optional[Sequence] = None
+        self._synced: List = []
+        self._cx: List[float] = []
+        self._cy: List[float] = []
+        self._vx: List[float] = []
+        self._vy: List[float] = []
+        self._r: List[float] = []
+        self._half_w: List[float] = []
+        self._half_h: List[float] = []
+        self._kind: List[int] = []
+        self._kind_counts: List[int] = [0] * len(KINDS)
+        self._hits: List[Tuple[int, int]] = []
+
+        # (image, rect) pairs for draw_all, rebuilt only for a new sprite set and
+        # patched in place on morph (rects are the sprites' own, moved by step)
+        self.blit_list: List[Tuple[pygame.Surface, pygame.Rect]] = []
+
+        # Broad-phase grid buffers, reused across frames
+        self._counts: List[int] = []
+        self._cell_start: List[int] = []
+        self._sorted_idx: List[int] = []
+        self._occupied: List[int] = []
+        self._members: List[Optional[List[int]]] = []
+
+        # Linearized neighbor offsets, cached for the last grid stride seen
+        self._stride: int = -1
+        self._neighbor_deltas: Tuple[int, ...] = ()
+
+        # Pair kernels specialized for the current tuning constants
+        self._kernel_key: Optional[Tuple[float, float, float]] = None
+        self._resolve_same: Callable[..., None]
+        self._resolve_cross: Callable[..., None]
+        self._compile_kernels()
 
     # ---------- public API ----------
 
-    def resolve_all(self, sprites: Sequence) -> None:
-
-        # 1) bucketize by cell
-        grid = defaultdict(list)
-        cs = self.cell_size
-        for i, s in enumerate(sprites):
-            cell = (int(s.cx // cs), int(s.cy // cs))
-            grid[cell].append(i)
-
-        # 2) for each cell and neighbors, resolve pairs
-        visited: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
-        neighbors = [(-1, -1), (0, -1), (1, -1),
-                     (-1,  0), (0,  0), (1,  0),
-                     (-1,  1), (0,  1), (1,  1)]
-
-        now = time.time()
-        for cell, idxs in grid.items():
-            for dx, dy in neighbors:
-                c2 = (cell[0] + dx, cell[1] + dy)
-                if c2 not in grid:
-                    continue
-                key = (min(cell, c2), max(cell, c2))
-                if key in visited:
-                    continue
-                visited.add(key)
-
-                # If same cell, use its list; otherwise merge two lists
-                if c2 == cell:
-                    self._resolve_list(idxs, sprites, now)
-                else:
-                    self._resolve_list(idxs + grid[c2], sprites, now)
+    def step(self, sprites: Sequence, dt: float, bounds) -> None:
+        """
+        Advance all sprites by dt in one batched pass: integrate, bounce off the
+        bounds rect (arena) and resolve collisions on the manager's flat arrays.
+        Replaces a per-sprite update(dt) loop followed by a collision pass.
+        Only morphs reach the sprites here; positions go to the blit rects via
+        sync_rects(), and flush() copies the full float state back on demand.
+        """
+        if not sprites:
+            return
+        # The flat arrays are the source of truth between steps; sprites are only
+        # gathered again when a different sprite set is passed in.
+        if sprites is not self._owner or len(sprites) != len(self._cx):
+            self._sync(sprites)
+        self._sim_time += dt
+        self._begin_frame()
+        self._integrate(dt, bounds)
+        self._resolve(len(sprites))
+        self._apply_morphs(sprites)
+
+    def sync_rects(self) -> None:
+        """
+        Move the blit rects to the current float positions. Call once per drawn
+        frame after step(), right before draw_all(blit_list).
+        """
+        cx, cy = self._cx, self._cy
+        for i, (_, rect) in enumerate(self.blit_list):
+            rect.center = (int(cx[i]), int(cy[i]))
+
+    def flush(self) -> None:
+        """Write the manager's position/velocity state back to the sprites (and their rects)."""
+        self._write_back(self._synced, range(len(self._synced)))
+
+    def kind_counts(self) -> Dict[str, int]:
+        """Sprites per kind as of the last step (kept by the manager, O(1))."""
+        return dict(zip(KINDS, self._kind_counts))
 
     # ---------- internals ----------
 
-    def _resolve_list(self, idxs: List[int], sprites: Sequence, now: float) -> None:
-
-        n = len(idxs)
-        for a_i in range(n):
-            A = sprites[idxs[a_i]]
-            ax, ay, ar = A.cx, A.cy, A.radius
-            for b_i in range(a_i + 1, n):
-                B = sprites[idxs[b_i]]
-
+    def _sync(self, sprites: Sequence) -> None:
+        """Gather sprite state into the flat arrays."""
+        # Hand the resident state back first: sprites only hold spawn-time (or
+        # last flushed) values, and sprites kept across the re-gather must not
+        # rewind to them
+        self.flush()
+
+        # First sight of the sprites' size: make sure morph surfaces exist now,
+        # so the morph path is a pure cache lookup (no loads mid-frame)
+        size = sprites[0].size
+        if self.assets.size is None:
+            self.assets.build(self.img_map, size)
+        elif self.assets.size != size:
+            raise ValueError(f"AssetCache built for {self.assets.size}, sprites are {size}")
+        if sprites is not self._owner or len(self._last_morph) != len(sprites):
+            # New sprite set: cooldowns are indexed by position, so they restart
+            # and every sprite may morph right away
+            self._last_morph = [self._sim_time - self.morph_cooldown] * len(sprites)
+        self._owner = sprites
+        self._synced = list(sprites)
+        self._cx = [s.cx for s in sprites]
+        self._cy = [s.cy for s in sprites]
+        self._vx = [s.vx for s in sprites]
+        self._vy = [s.vy for s in sprites]
+        self._r = [s.radius for s in sprites]
+        self._half_w = [s.rect.width * 0.5 for s in sprites]
+        self._half_h = [s.rect.height * 0.5 for s in sprites]
+        self._kind = kind = [s.kind_id for s in sprites]
+        self._kind_counts = [kind.count(k) for k in range(len(KINDS))]
+        self.blit_list = [(s.image, s.rect) for s in sprites]
+
+    def _compile_kernels(self) -> None:
+        self._kernel_key = (self.separation_bias, self.restitution, self.min_speed)
+        self._resolve_same, self._resolve_cross = _make_pair_kernels(*self._kernel_key)
+
+    def _begin_frame(self) -> None:
+        # _kind_counts is counted in _sync and kept current by _collect_morphs,
+        # so a decided round costs no per-frame recount
+        self._hits.clear()
+        self._morphs.clear()
+
+    def _integrate(self, dt: float, bounds) -> None:
+        """Move every sprite by v*dt and reflect it off the bounds edges."""
+        cx, cy, vx, vy = self._cx, self._cy, self._vx, self._vy
+        half_w, half_h = self._half_w, self._half_h
+        left, right, top, bottom = bounds.left, bounds.right, bounds.top, bounds.bottom
+        for i in range(len(cx)):
+            x = cx[i] + vx[i] * dt
+            y = cy[i] + vy[i] * dt
+
+            # Horizontal bounce
+            hw = half_w[i]
+            if x - hw <= left:
+                x = left + hw
+                vx[i] = -vx[i]
+            elif x + hw >= right:
+                x = right - hw
+                vx[i] = -vx[i]
+
+            # Vertical bounce
+            hh = half_h[i]
+            if y - hh <= top:
+                y = top + hh
+                vy[i] = -vy[i]
+            elif y + hh >= bottom:
+                y = bottom - hh
+                vy[i] = -vy[i]
+
+            cx[i] = x
+            cy[i] = y
+
+    def _write_back(self, sprites: Sequence, idxs: Iterable[int]) -> None:
+        cx, cy, vx, vy = self._cx, self._cy, self._vx, self._vy
+        for i in idxs:
+            s = sprites[i]
+            x, y = cx[i], cy[i]
+            s.cx = x
+            s.cy = y
+            rect = s.rect
+            rect.centerx = int(x)
+            rect.centery = int(y)
+            s.vx = vx[i]
+            s.vy = vy[i]
+
+    def _resolve(self, n: int) -> None:
+        """Broad + narrow phase over the synced flat arrays of n sprites."""
+        # Once a single kind is left no morph can happen; the round is decided
+        # and precise sprite-sprite collisions are no longer worth their cost.
+        if sum(1 for c in self._kind_counts if c > 0) <= 1:
+            return
 
-                dx = B.cx - ax
-                dy = B.cy - ay
-                r_sum = ar + B.radius
+        # 1) bucketize by cell: counting sort into flat arrays.
+        #    One empty cell of padding on every side keeps neighbor offsets in range.
+        cs = self.cell_size
+        gxs = [int(x // cs) for x in self._cx]
+        gys = [int(y // cs) for y in self._cy]
+        gx0 = min(gxs) - 1
+        gy0 = min(gys) - 1
+        stride = max(gxs) - gx0 + 2
+        ncells = stride * (max(gys) - gy0 + 2)
+        cells = [(gy - gy0) * stride + (gx - gx0) for gx, gy in zip(gxs, gys)]
+
+        # Buffers are pooled across frames: grown when needed, never reallocated
+        # per frame. Only the cells occupied last frame need zeroing.
+        counts = self._counts
+        if len(counts) < ncells:
+            counts = self._counts = [0] * ncells
+            self._cell_start = [0] * ncells
+        else:
+            for c in self._occupied:
+                counts[c] = 0
+        if len(self._sorted_idx) < n:
+            self._sorted_idx = [0] * n
+        cell_start = self._cell_start
+        sorted_idx = self._sorted_idx
+
+        # Everything below walks occupied cells only, so the per-frame cost
+        # scales with the sprite count, not with the number of grid cells.
+        self._occupied = occupied = []
+        for c in cells:
+            if not counts[c]:
+                occupied.append(c)
+            counts[c] += 1
+        acc = 0
+        for c in occupied:
+            acc += counts[c]
+            cell_start[c] = acc  # one past the end, until the scatter below
+
+        # Scatter back to front so each cell keeps ascending sprite order
+        for i in range(n - 1, -1, -1):
+            c = cells[i]
+            acc = cell_start[c] - 1
+            cell_start[c] = acc
+            sorted_idx[acc] = i
+
+        # 2) for each cell, resolve pairs against itself and its forward neighbors
+        if stride != self._stride:
+            self._stride = stride
+            self._neighbor_deltas = tuple(dy * stride + dx for dx, dy in _FORWARD_NEIGHBORS)
+        neighbors = self._neighbor_deltas
+
+        # Slice each occupied cell's members once; neighbor visits reuse them
+        members = self._members
+        if len(members) < ncells:
+            members = self._members = [None] * ncells
+        for c in occupied:
+            start = cell_start[c]
+            members[c] = sorted_idx[start:start + counts[c]]
+
+        if (self.separation_bias, self.restitution, self.min_speed) != self._kernel_key:
+            self._compile_kernels()  # tuning changed since the kernels were built
+        resolve_same, resolve_cross = self._resolve_same, self._resolve_cross
+
+        cx, cy, vx, vy, r = self._cx, self._cy, self._vx, self._vy, self._r
+        hits = self._hits
+        for c in occupied:
+            idxs = members[c]
+            if counts[c] > 1:  # a lone sprite has no same-cell pairs
+                resolve_same(idxs, cx, cy, vx, vy, r, hits)
+            for d in neighbors:
+                c2 = c + d
+                if counts[c2]:
+                    resolve_cross(idxs, members[c2], cx, cy, vx, vy, r, hits)
+
+        # 3) apply RPS morph rules to this frame's collisions, in order
+        _collect_morphs(hits, self._kind, self._kind_counts, self._last_morph,
+                        self._sim_time, self.morph_cooldown, self._morphs)
+
+    def _apply_morphs(self, sprites: Sequence) -> None:
+        get = self.assets.get
+        for i, target in self._morphs:
+            sprite = sprites[i]
+            target_kind = KINDS[target]
+            surface = get(target_kind)
+            sprite.morph_to(target_kind, surface)
+            self.blit_list[i] = (surface, sprite.rect)
+
+
+# ---------- kernels ----------
+
+def _make_pair_kernels(
+    separation_bias: float,
+    restitution: float,
+    min_speed: float,
+) -> Tuple[Callable[..., None], Callable[..., None]]:
+    """
+    Build (resolve_same_cell, resolve_cross_cell) with the tuning constants baked
+    in as closure cells, so the per-pair code neither reads manager attributes
+    nor passes them through every call.
+
+    resolve_same_cell(idxs, cx, cy, vx, vy, r, hits) separates, bounces and
+    speed-clamps every overlapping pair within idxs, in place on the flat arrays,
+    and appends each colliding pair to hits. resolve_cross_cell(idxs_a, idxs_b,
+    ...) does the same for every pair (a, b) with a in idxs_a and b in idxs_b.
+    """
+    min_sq = min_speed * min_speed
+
+    def collide(a, b, dx, dy, dist_sq, r_sum, cx, cy, vx, vy):
+        """Push an overlapping pair apart and swap their normal velocity components."""
+        # Compute normal
+        if dist_sq > 0.0:
+            # One sqrt + one division, then multiplies only
+            inv = 1.0 / sqrt(dist_sq)
+            dist = dist_sq * inv
+            nx = dx * inv
+            ny = dy * inv
+        else:
+            # Perfect overlap; pick an arbitrary normal
+            dist = 1.0
+            nx, ny = 1.0, 0.0
+
+        # --- Separate positions along the normal ---
+        half = 0.5 * (r_sum - dist) * separation_bias
+        ox = half * nx
+        oy = half * ny
+        cx[a] -= ox
+        cy[a] -= oy
+        cx[b] += ox
+        cy[b] += oy
+
+        # --- Resolve velocities: swap normal components ---
+        avx, avy, bvx, bvy = vx[a], vy[a], vx[b], vy[b]
+        va_n = avx * nx + avy * ny
+        vb_n = bvx * nx + bvy * ny
+
+        da = vb_n * restitution - va_n
+        db = va_n * restitution - vb_n
+
+        avx += da * nx
+        avy += da * ny
+        bvx += db * nx
+        bvy += db * ny
+        vx[a], vy[a], vx[b], vy[b] = avx, avy, bvx, bvy
+
+        # Enforce minimal speed (prevents stalls after head-on swaps).
+        # Squared test first: the common case needs no sqrt and no call.
+        if avx * avx + avy * avy < min_sq:
+            _enforce_min_speed(a, vx, vy, min_speed)
+        if bvx * bvx + bvy * bvy < min_sq:
+            _enforce_min_speed(b, vx, vy, min_speed)
+
+    def resolve_same_cell(idxs, cx, cy, vx, vy, r, hits):
+        for a_i, a in enumerate(idxs):
+            ax, ay, ar = cx[a], cy[a], r[a]
+            for b in idxs[a_i + 1:]:
+
+                # Cheap per-axis reject before the Euclidean test
+                r_sum = ar + r[b]
+                dx = cx[b] - ax
+                if dx >= r_sum or -dx >= r_sum:
+                    continue
+                dy = cy[b] - ay
+                if dy >= r_sum or -dy >= r_sum:
+                    continue
                 dist_sq = dx * dx + dy * dy
                 if dist_sq >= r_sum * r_sum:
                     continue  # no collision
 
-                # Compute normal
-                if dist_sq > 0.0:
-                    dist = math.sqrt(dist_sq)
-                    nx = dx / dist
-                    ny = dy / dist
-                else:
-                    # Perfect overlap; pick an arbitrary normal
-                    dist = 1.0
-                    nx, ny = 1.0, 0.0
-
-                # --- Separate positions along the normal ---
-                overlap = (r_sum - dist) * self.separation_bias
-                ax -= 0.5 * overlap * nx
-                ay -= 0.5 * overlap * ny
-                bx = B.cx + 0.5 * overlap * nx
-                by = B.cy + 0.5 * overlap * ny
-
-                A.set_center(ax, ay)
-                B.set_center(bx, by)
-
-                # --- Resolve velocities: swap normal components ---
-                va_n = A.vx * nx + A.vy * ny
-                vb_n = B.vx * nx + B.vy * ny
-
-                va_n_after = vb_n * self.restitution
-                vb_n_after = va_n * self.restitution
-
-                A.vx += (va_n_after - va_n) * nx
-                A.vy += (va_n_after - va_n) * ny
-                B.vx += (vb_n_after - vb_n) * nx
-                B.vy += (vb_n_after - vb_n) * ny
-
-                # Enforce minimal speed (prevents stalls after head-on swaps)
-                self._enforce_min_speed(A)
-                self._enforce_min_speed(B)
-
-                # --- Apply RPS morph rules ---
-                self._apply_rps_rules(A, B, now)
-
-    def _apply_rps_rules(self, a, b, now: float) -> None:
-
-        ka, kb = a.kind, b.kind
-
-        # paper vs stone
-        if (ka == "paper" and kb == "stone"):
-            self._try_morph(b, "paper", now)
-        elif (ka == "stone" and kb == "paper"):
-            self._try_morph(a, "paper", now)
-
-        # stone vs scissors
-        elif (ka == "stone" and kb == "scissors"):
-            self._try_morph(b, "stone", now)
-        elif (ka == "scissors" and kb == "stone"):
-            self._try_morph(a, "stone", now)
-
-        # scissors vs paper
-        elif (ka == "scissors" and kb == "paper"):
-            self._try_morph(b, "scissors", now)
-        elif (ka == "paper" and kb == "scissors"):
-            self._try_morph(a, "scissors", now)
-
-    def _try_morph(self, sprite, target_kind: str, now: float) -> None:
-        sid = id(sprite)
-        last = self._last_morph.get(sid, 0.0)
-        if (now - last) < self.morph_cooldown:
-            return  
-
-        # Skip if already that kind
-        if getattr(sprite, "kind", None) == target_kind:
-            return
+                collide(a, b, dx, dy, dist_sq, r_sum, cx, cy, vx, vy)
+                hits.append((a, b))
+                ax, ay = cx[a], cy[a]
 
-        # Prefer fast path with cached surface if available
-        if self.assets is not None and hasattr(sprite, "morph_to_cached"):
-            cached = self.assets.get(target_kind)
-            sprite.morph_to_cached(target_kind, cached)
-        else:
-            # Fallback: load/scale via sprite.morph_to (slower)
-            sprite.morph_to(target_kind, self.img_map[target_kind])
+    def resolve_cross_cell(idxs_a, idxs_b, cx, cy, vx, vy, r, hits):
+        for a in idxs_a:
+            ax, ay, ar = cx[a], cy[a], r[a]
+            for b in idxs_b:
 
-        self._last_morph[sid] = now
+                # Cheap per-axis reject before the Euclidean test
+                r_sum = ar + r[b]
+                dx = cx[b] - ax
+                if dx >= r_sum or -dx >= r_sum:
+                    continue
+                dy = cy[b] - ay
+                if dy >= r_sum or -dy >= r_sum:
+                    continue
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= r_sum * r_sum:
+                    continue  # no collision
 
-    def _enforce_min_speed(self, S) -> None:
-        """Ensure sprite's speed is not below min_speed; keep direction if possible."""
-        spd = math.hypot(S.vx, S.vy)
-        if spd >= self.min_speed:
-            return
-        if spd < 1e-6:
-            ang = random.uniform(0.0, 360.0)
-            S.vx = math.cos(math.radians(ang)) * self.min_speed
-            S.vy = math.sin(math.radians(ang)) * self.min_speed
+                collide(a, b, dx, dy, dist_sq, r_sum, cx, cy, vx, vy)
+                hits.append((a, b))
+                ax, ay = cx[a], cy[a]
+
+    return resolve_same_cell, resolve_cross_cell
+
+
+def _enforce_min_speed(i: int, vx: List[float], vy: List[float], min_speed: float) -> None:
+    """Raise sprite i's speed to min_speed; keep direction if possible."""
+    x, y = vx[i], vy[i]
+    spd_sq = x * x + y * y
+    if spd_sq < 1e-12:
+        # Stalled: random direction from the precomputed table (no trig)
+        x, y = _UNIT_DIRS[random.getrandbits(_DIR_BITS)]
+        vx[i] = x * min_speed
+        vy[i] = y * min_speed
+        return
+    k = min_speed / sqrt(spd_sq)
+    vx[i] = x * k
+    vy[i] = y * k
+
+
+def _collect_morphs(
+    hits: List[Tuple[int, int]],
+    kind: List[int],
+    kind_counts: List[int],
+    last_morph: List[float],
+    now: float,
+    cooldown: float,
+    morphs: List[Tuple[int, int]],
+) -> None:
+    """
+    Apply RPS rules to the colliding pairs in hits, updating kind and
+    kind_counts in place.
+    Each accepted morph is appended to morphs as (index, target_kind_id).
+    """
+    table = _MORPH_TARGET
+    for a, b in hits:
+        ka, kb = kind[a], kind[b]
+
+        target = table[ka * 3 + kb]
+        if target >= 0:
+            loser = a
         else:
-            k = self.min_speed / spd
-            S.vx *= k
-            S.vy *= k
+            target = table[kb * 3 + ka]
+            if target < 0:
+                continue  # same kind
+            loser = b
+
+        if (now - last_morph[loser]) < cooldown:
+            continue
+
+        kind_counts[kind[loser]] -= 1
+        kind_counts[target] += 1
+        kind[loser] = target
+        last_morph[loser] = now
+        morphs.append((loser, target))
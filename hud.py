@@ -1,5 +1,4 @@
 import pygame
-from collections import Counter
 
 class HUD:
     """Real-time counters for R/P/S, drawn above the arena."""
@@ -10,21 +9,36 @@ class HUD:
         self.bg_color = (245, 245, 245)   # subtle background for readability
         self.pad = 6
 
-    def update_counts(self, sprites) -> None:
-        c = Counter(s.kind for s in sprites)
-        self.counts["scissors"] = c.get("scissors", 0)
-        self.counts["stone"]    = c.get("stone", 0)
-        self.counts["paper"]    = c.get("paper", 0)
+        # Rendered pill + label, reused until the counts change
+        self._cached_key: tuple[int, int, int] | None = None
+        self._cached_surf: pygame.Surface | None = None
 
-    def draw(self, screen: pygame.Surface, arena_rect: pygame.Rect) -> None:
-        label = f"Scissors: {self.counts['scissors']}   Stone: {self.counts['stone']}   Paper: {self.counts['paper']}"
-        surf = self.font.render(label, True, self.text_color)
-        # place centered above arena
-        y = arena_rect.top - surf.get_height() - 8
+    def set_counts(self, counts) -> None:
+        """Take counts computed elsewhere (e.g. CollisionManager.kind_counts())."""
+        self.counts.update(counts)
+
+    def draw(self, screen: pygame.Surface, arena_rect: pygame.Rect) -> pygame.Rect:
+        """Draw the counters and return the screen area they cover."""
+        key = (self.counts["scissors"], self.counts["stone"], self.counts["paper"])
+        if key != self._cached_key:
+            self._cached_surf = self._render(key)
+            self._cached_key = key
+        surf = self._cached_surf
+        # place centered above arena (text keeps its original position inside the pad)
+        text_h = surf.get_height() - 2 * self.pad
+        y = arena_rect.top - text_h - 8
         if y < 4:
             y = arena_rect.top + 4
-        x = arena_rect.centerx - surf.get_width() // 2
+        x = arena_rect.centerx - (surf.get_width() - 2 * self.pad) // 2
+
+        return screen.blit(surf, (x - self.pad, y - self.pad))
 
-        bg_rect = pygame.Rect(x - self.pad, y - self.pad, surf.get_width() + 2*self.pad, surf.get_height() + 2*self.pad)
-        pygame.draw.rect(screen, self.bg_color, bg_rect, border_radius=8)
-        screen.blit(surf, (x, y))
+    def _render(self, key: tuple[int, int, int]) -> pygame.Surface:
+        """Pre-bake background pill + label into one surface, so draw() is a single blit."""
+        label = f"Scissors: {key[0]}   Stone: {key[1]}   Paper: {key[2]}"
+        text = self.font.render(label, True, self.text_color)
+        w, h = text.get_width() + 2 * self.pad, text.get_height() + 2 * self.pad
+        surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(surf, self.bg_color, surf.get_rect(), border_radius=8)
+        surf.blit(text, (self.pad, self.pad))
+        return surf
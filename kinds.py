@@ -0,0 +1,5 @@
+from typing import Dict, Tuple
+
+# Sprite kinds and their integer ids (used by the collision kernels and counters)
+KINDS: Tuple[str, ...] = ("scissors", "stone", "paper")
+KIND_ID: Dict[str, int] = {k: i for i, k in enumerate(KINDS)}
@@ -1,7 +1,7 @@
 import pygame
 from arena import Arena
 from start_screen import StartScreen
-from RPS import Scissors, Stone, Paper
+from RPS import Scissors, Stone, Paper, draw_all
 from collisions import CollisionManager
 from hud import HUD
 from winner_overlay import WinnerOverlay
@@ -17,6 +17,7 @@ IMG_MAP = {
 }
 
 PANEL_WIDTH = 220  # room for buttons + scoreboard on the right
+HUD_INTERVAL = 0.1  # seconds between HUD counter refreshes (~10 Hz)
 
 
 # ---------- sizing ----------
@@ -58,18 +59,19 @@ def make_collision_manager_for(sprites, assets: AssetCache) -> CollisionManager:
 
 # ---------- spawning ----------
 
-def spawn_sprites(n: int, arena: Arena) -> list:
+def spawn_sprites(n: int, arena: Arena, assets: AssetCache) -> list:
     """Spawn n of each icon at random positions inside the arena."""
     size = icon_size_for(n)
     pad = (max(size) // 2) + 6  # keep sprites away from arena walls
+    # Sprites share the cached surfaces (assets must be built for this size)
+    scissors, stone, paper = assets.get("scissors"), assets.get("stone"), assets.get("paper")
+    # All 3n centers in one batch, consumed in spawn order
+    points = iter(arena.random_points(3 * n, padding=pad))
     sprites = []
     for _ in range(n):
-        sprites.append(Scissors(IMG_MAP["scissors"], arena.rect, size=size,
-                                center=arena.random_point(padding=pad, float_coords=True)))
-        sprites.append(Stone(   IMG_MAP["stone"],    arena.rect, size=size,
-                                center=arena.random_point(padding=pad, float_coords=True)))
-        sprites.append(Paper(   IMG_MAP["paper"],    arena.rect, size=size,
-                                center=arena.random_point(padding=pad, float_coords=True)))
+        sprites.append(Scissors(scissors, arena.rect, center=next(points)))
+        sprites.append(Stone(   stone,    arena.rect, center=next(points)))
+        sprites.append(Paper(   paper,    arena.rect, center=next(points)))
     return sprites
 
 
@@ -99,31 +101,57 @@ def main() -> None:
 
     # Initial round: build cache for current size, then spawn & collisions
     assets.build(IMG_MAP, icon_size_for(n))
-    sprites = spawn_sprites(n, arena)
+    overlay.prebuild(arena.rect)  # the arena never resizes, so once is enough
+    sprites = spawn_sprites(n, arena, assets)
     collisions = make_collision_manager_for(sprites, assets)
 
     # Round state
     round_active = True
     running = True
+    hud_accum = HUD_INTERVAL  # refresh the HUD on the first frame
+
+    # Static screen content (fill, winner overlay, arena, panel, scoreboard),
+    # rebuilt only when it changes; None forces a rebuild + full present
+    background: pygame.Surface | None = None
+    # Dirty rects of the last and the current frame: two pooled lists whose Rects
+    # are updated in place and swapped each frame (no per-frame Rect allocation)
+    prev_rects: list[pygame.Rect] = []
+    rects: list[pygame.Rect] = []
+
+    def build_background(counts) -> pygame.Surface:
+        bg = pygame.Surface(screen.get_size()).convert()
+        bg.fill((255, 255, 255))
+        overlay.draw_if_winner(bg, arena.rect, counts)  # winner background
+        arena.draw(bg)
+        panel.draw(bg)
+
+        sb_x = panel.buttons[0].rect.left
+        sb_y = panel.buttons[-1].rect.bottom + 30
+        scoreboard.draw(bg, sb_x, sb_y)
+        return bg
 
     # --- actions ---
 
     def restart_simulation():
-        nonlocal sprites, collisions, round_active
+        nonlocal sprites, collisions, round_active, background, hud_accum
         # rebuild cache in case size changes with n
         assets.build(IMG_MAP, icon_size_for(n))
-        sprites = spawn_sprites(n, arena)
+        sprites = spawn_sprites(n, arena, assets)
         collisions = make_collision_manager_for(sprites, assets)
         round_active = True
+        background = None
+        hud_accum = HUD_INTERVAL
 
     def restart_to_start(scr, w, h):
-        nonlocal sprites, collisions, n, round_active
+        nonlocal sprites, collisions, n, round_active, background, hud_accum
         n = StartScreen(scr).run()
         scoreboard.reset()
         assets.build(IMG_MAP, icon_size_for(n))
-        sprites = spawn_sprites(n, arena)
+        sprites = spawn_sprites(n, arena, assets)
         collisions = make_collision_manager_for(sprites, assets)
         round_active = True
+        background = None
+        hud_accum = HUD_INTERVAL
 
     def exit_game():
         nonlocal running
@@ -144,37 +172,56 @@ def main() -> None:
                 restart_simulation()
             panel.handle_event(event)
 
-        # Physics
-        for s in sprites:
-            s.update(dt)
-        collisions.resolve_all(sprites)
+        # Physics: integrate, bounce and collide all sprites in one batched pass
+        collisions.step(sprites, dt, arena.rect)
 
-        # Counts for HUD
-        hud.update_counts(sprites)
-        counts = hud.counts
+        # Counts are tracked by the collision manager; no per-sprite recount
+        counts = collisions.kind_counts()
 
         # Detect winner
         alive = [k for k, v in counts.items() if v > 0]
         if round_active and len(alive) == 1:
             scoreboard.add_win(alive[0])
             round_active = False
+            background = None  # overlay + scoreboard changed
+            hud_accum = HUD_INTERVAL  # show the final counts right away
 
-        # --- draw ---
-        screen.fill((255, 255, 255))
-        overlay.draw_if_winner(screen, arena.rect, counts)  # winner background
-        arena.draw(screen)
-        hud.draw(screen, arena.rect)
-
-        for s in sprites:
-            s.draw(screen)
+        # HUD counters refresh at ~10 Hz instead of every physics tick
+        hud_accum += dt
+        if hud_accum >= HUD_INTERVAL:
+            hud.set_counts(counts)
+            hud_accum = 0.0
 
-        panel.draw(screen)
-
-        sb_x = panel.buttons[0].rect.left
-        sb_y = panel.buttons[-1].rect.bottom + 30
-        scoreboard.draw(screen, sb_x, sb_y)
-
-        pygame.display.flip()
+        # --- draw ---
+        # Nothing is visible while minimized; keep simulating, skip rendering
+        if not pygame.display.get_active():
+            background = None  # repaint everything once restored
+            continue
+
+        full = background is None
+        if full:
+            background = build_background(counts)
+            screen.blit(background, (0, 0))
+        else:
+            # Erase last frame's sprites and HUD by restoring the background
+            for r in prev_rects:
+                screen.blit(background, r, r)
+
+        collisions.sync_rects()
+        blits = collisions.blit_list
+        draw_all(screen, blits)
+        if len(rects) != len(blits) + 1:  # sprite count changed (new round)
+            rects = [pygame.Rect(0, 0, 0, 0) for _ in range(len(blits) + 1)]
+        for r, (_, sprite_rect) in zip(rects, blits):
+            r.update(sprite_rect)
+        rects[-1].update(hud.draw(screen, arena.rect))
+
+        # Present only what changed: old + new sprite/HUD areas
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(prev_rects + rects)
+        prev_rects, rects = rects, prev_rects
 
     pygame.quit()
 
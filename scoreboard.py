@@ -10,6 +10,11 @@ class Scoreboard:
         self.color_title = (30, 30, 30)
         self.color_text  = (20, 20, 20)
 
+        # Title never changes; line surfaces are re-rendered only when counts do
+        self._title = self.font_title.render("Scoreboard", True, self.color_title)
+        self._cached_key: tuple[int, int, int] | None = None
+        self._cached_lines: list[pygame.Surface] = []
+
     def reset(self) -> None:
         self.counts = {"scissors": 0, "stone": 0, "paper": 0}
 
@@ -19,13 +24,18 @@ class Scoreboard:
 
     def draw(self, screen: pygame.Surface, x: int, y: int) -> None:
         # Title
-        title = self.font_title.render("Scoreboard", True, self.color_title)
+        title = self._title
         screen.blit(title, (x, y))
         y += title.get_height() + 8
 
         # Lines
-        for label in ("Scissors", "Stone", "Paper"):
-            key = label.lower()
-            line = self.font_line.render(f"{label}: {self.counts[key]}", True, self.color_text)
+        key = (self.counts["scissors"], self.counts["stone"], self.counts["paper"])
+        if key != self._cached_key:
+            self._cached_lines = [
+                self.font_line.render(f"{label}: {count}", True, self.color_text)
+                for label, count in zip(("Scissors", "Stone", "Paper"), key)
+            ]
+            self._cached_key = key
+        for line in self._cached_lines:
             screen.blit(line, (x, y))
             y += line.get_height() + 4
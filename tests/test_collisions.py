@@ -0,0 +1,130 @@
+"""
+Headless checks for CollisionManager (no pygame needed): the grid broad phase
+must report exactly the overlapping pairs a brute-force scan finds, and the
+kind counts kept by the manager must follow the morphs.
+"""
+import os
+import random
+import sys
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collisions import CollisionManager  # noqa: E402
+from kinds import KINDS, KIND_ID  # noqa: E402
+
+ICON = 32
+ARENA = 600
+
+
+class _Rect:
+    def __init__(self, w, h):
+        self.width, self.height = w, h
+        self.centerx = self.centery = 0
+
+
+class _Bounds:
+    left, top, right, bottom = 0, 0, ARENA, ARENA
+
+
+class _Assets:
+    size = (ICON, ICON)
+
+    def get(self, kind):
+        return kind
+
+
+class _Sprite:
+    def __init__(self, kind, x, y, rng):
+        self.kind, self.kind_id = kind, KIND_ID[kind]
+        self.cx, self.cy = x, y
+        self.vx, self.vy = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        self.size = (ICON, ICON)
+        self.rect = _Rect(ICON, ICON)
+        self.radius = 0.30 * ICON  # RPS.RADIUS_FACTOR
+        self.image = None
+
+    def morph_to(self, kind, surface):
+        self.kind, self.kind_id, self.image = kind, KIND_ID[kind], surface
+
+
+def _layout(rng, n, extent):
+    lo = ICON // 2 + 1
+    return [_Sprite(rng.choice(KINDS), rng.uniform(lo, extent), rng.uniform(lo, extent), rng)
+            for _ in range(n)]
+
+
+def _manager():
+    # Same cell sizing rule as main.make_collision_manager_for
+    return CollisionManager(img_map={}, asset_cache=_Assets(), cell_size=int(ICON * 1.2))
+
+
+class BroadPhaseTest(unittest.TestCase):
+
+    def test_reports_exactly_the_overlapping_pairs(self):
+        rng = random.Random(1234)
+        for layout in range(300):
+            n = rng.randint(2, 120)
+            sprites = _layout(rng, n, rng.choice((120, 300, ARENA - ICON)))
+            # mix kinds so the "round decided" early exit never kicks in
+            sprites[0].kind, sprites[0].kind_id = "stone", KIND_ID["stone"]
+            sprites[1].kind, sprites[1].kind_id = "paper", KIND_ID["paper"]
+
+            expected = set()
+            for a in range(n):
+                for b in range(a + 1, n):
+                    sa, sb = sprites[a], sprites[b]
+                    dx, dy = sb.cx - sa.cx, sb.cy - sa.cy
+                    r_sum = sa.radius + sb.radius
+                    if dx * dx + dy * dy < r_sum * r_sum:
+                        expected.add((a, b))
+
+            cm = _manager()
+            reported = []
+
+            # Record candidate overlaps without resolving them, so positions stay
+            # put and the grid's pairs can be compared with the brute force
+            def record(idxs_a, idxs_b, cx, cy, r):
+                for a in idxs_a:
+                    for b in idxs_b:
+                        if a == b:
+                            continue
+                        dx, dy = cx[b] - cx[a], cy[b] - cy[a]
+                        r_sum = r[a] + r[b]
+                        if dx * dx + dy * dy < r_sum * r_sum:
+                            reported.append((min(a, b), max(a, b)))
+
+            def same(idxs, cx, cy, vx, vy, r, hits):
+                for i, a in enumerate(idxs):
+                    record([a], idxs[i + 1:], cx, cy, r)
+
+            def cross(idxs_a, idxs_b, cx, cy, vx, vy, r, hits):
+                record(idxs_a, idxs_b, cx, cy, r)
+
+            cm._resolve_same, cm._resolve_cross = same, cross
+            cm.step(sprites, 0.0, _Bounds)
+
+            self.assertEqual(len(reported), len(set(reported)), f"layout {layout}: duplicate pairs")
+            self.assertEqual(set(reported), expected, f"layout {layout}")
+
+
+class KindCountsTest(unittest.TestCase):
+
+    def test_counts_follow_morphs(self):
+        rng = random.Random(99)
+        sprites = _layout(rng, 150, ARENA - ICON)
+        cm = _manager()
+        initial = Counter(s.kind for s in sprites)
+
+        for _ in range(600):
+            cm.step(sprites, 1 / 120, _Bounds)
+            actual = Counter(s.kind for s in sprites)
+            self.assertEqual(cm.kind_counts(), {k: actual[k] for k in KINDS})
+            self.assertTrue(all(s.kind_id == KIND_ID[s.kind] for s in sprites))
+
+        self.assertNotEqual(Counter(s.kind for s in sprites), initial, "no morph happened")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,10 @@ class WinnerOverlay:
     """
     Draws a stretched background image inside the arena when only one type remains.
     """
-    def __init__(self, img_map: Dict[str, str]):
+    def __init__(self, img_map: Dict[str, str], bg_color: Tuple[int, int, int] = (255, 255, 255)):
         # e.g. {"scissors": "scissors.png", "stone": "stone.png", "paper": "paper.png"}
         self.img_map = img_map
+        self.bg_color = bg_color  # what transparent areas are flattened onto
         self._cache: Dict[Tuple[str, Tuple[int,int]], pygame.Surface] = {}
 
     def _get_scaled(self, kind: str, size: Tuple[int, int]) -> pygame.Surface:
@@ -16,8 +17,22 @@ class WinnerOverlay:
             return self._cache[key]
         surf = pygame.image.load(self.img_map[kind]).convert_alpha()
         scaled = pygame.transform.smoothscale(surf, size)
-        self._cache[key] = scaled
-        return scaled
+        # Flatten onto an opaque screen-format surface: the per-frame blit is then
+        # a plain copy with no per-pixel alpha blending
+        opaque = pygame.Surface(size).convert()
+        opaque.fill(self.bg_color)
+        opaque.blit(scaled, (0, 0))
+        self._cache[key] = opaque
+        return opaque
+
+    def prebuild(self, arena_rect: pygame.Rect) -> None:
+        """
+        Load and scale every winner background for this arena up front, so the
+        first winner frame does not stall on image decode + smoothscale.
+        """
+        size = (arena_rect.width, arena_rect.height)
+        for kind in self.img_map:
+            self._get_scaled(kind, size)
 
     def draw_if_winner(self, screen: pygame.Surface, arena_rect: pygame.Rect, counts: Dict[str, int]) -> bool:
         """